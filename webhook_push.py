@@ -7,73 +7,220 @@ No server required!
 
 import os
 import sys
+import gzip
 import json
 import time
+import signal
 import argparse
+import threading
 import psutil
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from operator import itemgetter
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional
 
 try:
     import docker
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print("ERROR: Missing required packages. Install with:")
     print("  pip install docker requests")
     sys.exit(1)
 
+# Optional faster JSON encoder/decoder; falls back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Upper bound on concurrent stats requests so large hosts don't flood the daemon
+MAX_STATS_WORKERS = 32
+
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Sort keys for the sort_by setting; every container dict carries these fields
+SORT_KEYS = {
+    'cpu': itemgetter('cpu_percent'),
+    'memory': itemgetter('memory_percent'),
+    'name': itemgetter('name'),
+    'status': itemgetter('status'),
+}
+
+# Prime psutil so later cpu_percent(interval=None) calls report usage since the
+# previous call instead of sleeping to take a sample
+psutil.cpu_percent(interval=None)
+
+# Shared webhook session so --loop reuses the TCP/TLS connection between pushes
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+SESSION.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+SESSION.headers.update({
+    'Content-Type': 'application/json',
+    'Connection': 'keep-alive',
+})
+
+# Single background worker so --loop pushes never block the next collection
+PUSH_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# Set on SIGTERM to end the --loop wait immediately
+_stop = threading.Event()
+
+
+@dataclass
+class ContainerMeta:
+    """Container details that only change when the container changes state"""
+    status: str
+    started_at: Optional[datetime]
+    restart_count: int
+    name: str
+    image: str
+
+
+# Cached ContainerMeta per container id, reused across --loop ticks. Entries
+# are dropped on a state change or when the container (re)starts.
+_CONTAINER_META: Dict[str, ContainerMeta] = {}
+
+# Unix time of the previous collection, bounding the restart check
+_last_collect: Optional[int] = None
+
+
+def invalidate_restarted(client: docker.DockerClient, since: int, until: int) -> None:
+    """Drop cached metadata of containers started between since and until"""
+    # An in-place restart keeps the 'running' state, so ask the daemon
+    for event in client.events(since=since, until=until, decode=True,
+                               filters={'type': 'container', 'event': 'start'}):
+        _CONTAINER_META.pop(event['id'], None)
+
+
+def get_container_meta(client: docker.DockerClient, container: Dict[str, Any]) -> Optional[ContainerMeta]:
+    """Return cached metadata for a /containers/json entry, refreshing it after a state change
+
+    Returns None if the container was removed since it was listed.
+    """
+    container_id = container['Id']
+    status = container['State']
+    meta = _CONTAINER_META.get(container_id)
+    if meta is None or meta.status != status:
+        # StartedAt and RestartCount are only reported by inspect
+        try:
+            attrs = client.api.inspect_container(container_id)
+        except docker.errors.NotFound:
+            return None
+        image = container['Image']
+        meta = ContainerMeta(
+            status=status,
+            started_at=parse_started_at(attrs['State']['StartedAt']),
+            restart_count=attrs.get('RestartCount', 0),
+            name=container['Names'][0].lstrip('/'),
+            image=image[:17] if image.startswith('sha256:') else image,
+        )
+        _CONTAINER_META[container_id] = meta
+    return meta
 
-def format_uptime(started_at: str) -> str:
-    """Format container uptime in human-readable format"""
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def parse_started_at(started_at: str) -> Optional[datetime]:
+    """Parse a Docker UTC timestamp such as 2024-01-15T10:23:45.123456789Z"""
     try:
-        start_time = datetime.fromisoformat(started_at.replace('Z', '+00:00'))
-        uptime = datetime.now(start_time.tzinfo) - start_time
+        # Drop the fractional seconds: Docker emits nanoseconds, which older
+        # Pythons' fromisoformat rejects, and uptime only needs minutes
+        return datetime.fromisoformat(started_at[:19]).replace(tzinfo=timezone.utc)
+    except (TypeError, ValueError):
+        return None
 
-        days = uptime.days
-        hours, remainder = divmod(uptime.seconds, 3600)
-        minutes, _ = divmod(remainder, 60)
 
-        if days > 0:
-            return f"{days}d {hours}h"
-        elif hours > 0:
-            return f"{hours}h {minutes}m"
-        else:
-            return f"{minutes}m"
-    except:
+def format_uptime(start_time: Optional[datetime]) -> str:
+    """Format container uptime in human-readable format"""
+    if start_time is None:
         return "unknown"
 
+    uptime = datetime.now(timezone.utc) - start_time
+
+    days = uptime.days
+    hours, remainder = divmod(uptime.seconds, 3600)
+    minutes, _ = divmod(remainder, 60)
+
+    if days > 0:
+        return f"{days}d {hours}h"
+    elif hours > 0:
+        return f"{hours}h {minutes}m"
+    else:
+        return f"{minutes}m"
+
 
 def format_bytes(bytes_value: int) -> str:
     """Format bytes to human-readable string"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f}{unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f}TB"
+    bytes_value = int(bytes_value)
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    unit_idx = min(len(BYTE_UNITS) - 1, (bytes_value.bit_length() - 1) // 10) if bytes_value > 0 else 0
+    return f"{bytes_value / (1 << (unit_idx * 10)):.1f}{BYTE_UNITS[unit_idx]}"
 
 
-def get_container_stats(client: docker.DockerClient, container: docker.models.containers.Container,
-                        cpu_threshold: int, memory_threshold: int) -> Dict[str, Any]:
-    """Get statistics for a single container"""
-    try:
-        # Get stats twice with a short delay for accurate CPU calculation
-        stats1 = container.stats(stream=False)
-        time.sleep(0.1)  # 100ms delay
-        stats = container.stats(stream=False)
+def idle_stats(compact: bool = False) -> Dict[str, Any]:
+    """Stats for a container that is not running or has no usable sample"""
+    return {
+        "cpu_percent": 0,
+        "memory_percent": 0,
+        "has_alert": False,
+        "alert_messages": None if compact else []
+    }
+
+
+def is_empty_sample(stats: Dict[str, Any]) -> bool:
+    """Whether a stats sample has no cpu/memory data (container not running)"""
+    return not stats.get('cpu_stats', {}).get('system_cpu_usage') or not stats.get('memory_stats')
 
-        # Calculate CPU percentage using the two measurements (matches Docker CLI calculation)
-        cpu_delta = stats['cpu_stats']['cpu_usage']['total_usage'] - \
-                   stats1['cpu_stats']['cpu_usage']['total_usage']
-        system_delta = stats['cpu_stats']['system_cpu_usage'] - \
-                      stats1['cpu_stats']['system_cpu_usage']
 
+def get_container_stats(client: docker.DockerClient, container_id: str,
+                        cpu_threshold: int, memory_threshold: int,
+                        stats: Optional[Dict[str, Any]] = None, compact: bool = False) -> Dict[str, Any]:
+    """Get statistics for a single container, from stats if already read
+
+    With compact set, sizes are sent as raw byte counts and an empty alert
+    list as None, leaving formatting to the TRMNL template.
+    """
+    try:
+        if stats is None:
+            # A single non-streaming read: the daemon fills precpu_stats with the
+            # previous sample, so no second request is needed for the CPU delta.
+            # The low-level API returns the decoded dict without building a Container.
+            stats = client.api.stats(container_id, stream=False)
+
+        # A container that just (re)started reports empty cpu/memory stats
+        if is_empty_sample(stats):
+            return idle_stats(compact)
+
+        # Calculate CPU percentage against the previous sample (matches Docker CLI calculation).
+        # The first sample of a stream has no previous sample to compare against.
+        precpu_stats = stats.get('precpu_stats', {})
         cpu_percent = 0.0
-        if system_delta > 0 and cpu_delta >= 0:
-            # Get number of CPUs from online_cpus if available, otherwise use percpu_usage length
-            num_cpus = stats['cpu_stats'].get('online_cpus',
-                                              len(stats['cpu_stats']['cpu_usage'].get('percpu_usage', [1])))
-            # Calculate percentage: (container CPU delta / system CPU delta) * number of CPUs * 100
-            cpu_percent = (cpu_delta / system_delta) * num_cpus * 100.0
+        if precpu_stats.get('system_cpu_usage'):
+            cpu_delta = stats['cpu_stats']['cpu_usage']['total_usage'] - \
+                       precpu_stats['cpu_usage']['total_usage']
+            system_delta = stats['cpu_stats']['system_cpu_usage'] - precpu_stats['system_cpu_usage']
+
+            if system_delta > 0 and cpu_delta >= 0:
+                # Get number of CPUs from online_cpus if available, otherwise use percpu_usage length
+                num_cpus = stats['cpu_stats'].get('online_cpus',
+                                                  len(stats['cpu_stats']['cpu_usage'].get('percpu_usage', [1])))
+                # Calculate percentage: (container CPU delta / system CPU delta) * number of CPUs * 100
+                cpu_percent = (cpu_delta / system_delta) * num_cpus * 100.0
 
         # Calculate memory percentage
         memory_usage = stats['memory_stats'].get('usage', 0)
@@ -88,21 +235,36 @@ def get_container_stats(client: docker.DockerClient, container: docker.models.co
                 network_rx += net_stats.get('rx_bytes', 0)
                 network_tx += net_stats.get('tx_bytes', 0)
 
+        # Round once for both the alert messages and the payload
+        cpu_rounded = round(cpu_percent, 1)
+        memory_rounded = round(memory_percent, 1)
+
         # Check for alerts
         alerts = []
         has_alert = False
 
         if cpu_percent >= cpu_threshold:
-            alerts.append(f"High CPU usage: {cpu_percent:.1f}%")
+            alerts.append(f"High CPU usage: {cpu_rounded}%")
             has_alert = True
 
         if memory_percent >= memory_threshold:
-            alerts.append(f"High memory usage: {memory_percent:.1f}%")
+            alerts.append(f"High memory usage: {memory_rounded}%")
             has_alert = True
 
+        if compact:
+            return {
+                "cpu_percent": cpu_rounded,
+                "memory_percent": memory_rounded,
+                "memory_usage_bytes": memory_usage,
+                "network_rx_bytes": network_rx,
+                "network_tx_bytes": network_tx,
+                "has_alert": has_alert,
+                "alert_messages": alerts or None
+            }
+
         return {
-            "cpu_percent": round(cpu_percent, 1),
-            "memory_percent": round(memory_percent, 1),
+            "cpu_percent": cpu_rounded,
+            "memory_percent": memory_rounded,
             "memory_usage": format_bytes(memory_usage),
             "network_rx": format_bytes(network_rx),
             "network_tx": format_bytes(network_tx),
@@ -110,183 +272,296 @@ def get_container_stats(client: docker.DockerClient, container: docker.models.co
             "alert_messages": alerts
         }
     except Exception as e:
-        return {
+        return idle_stats(compact)
+
+
+class StatsStreamer:
+    """Keep the latest stats sample of every running container from streaming reads
+
+    Each running container gets a daemon thread consuming its stats stream
+    (one sample per second over a single connection). Containers started
+    later are picked up from the events stream. Once a container stops the
+    daemon only sends empty samples, so its thread ends on the first one and
+    the events stream subscribes again if the container is restarted.
+    """
+
+    def __init__(self, client: docker.DockerClient):
+        self._client = client
+        self._lock = threading.Lock()
+        self._latest: Dict[str, Dict[str, Any]] = {}
+        self._watched = set()
+        self._stopped = threading.Event()
+        self._events = None
+        self._events_thread = None
+
+    def start(self) -> None:
+        """Start streaming stats for running containers and watching for new ones"""
+        self._events = self._client.events(decode=True, filters={'type': 'container', 'event': 'start'})
+        for container in self._client.api.containers():
+            self._watch(container['Id'])
+        self._events_thread = threading.Thread(target=self._watch_events, daemon=True)
+        self._events_thread.start()
+
+    def is_alive(self) -> bool:
+        """Whether new containers are still being picked up from the events stream"""
+        return self._events_thread is not None and self._events_thread.is_alive()
+
+    def stop(self) -> None:
+        """Stop all streams, releasing their connections to the daemon"""
+        self._stopped.set()
+        # Stats streams check the flag after each (per-second) sample, but the
+        # events stream can stay idle indefinitely, so close it directly
+        if self._events is not None:
+            try:
+                self._events.close()
+            except Exception:
+                # Best effort: e.g. docker-py can't cancel streams over ssh://
+                pass
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the latest stats sample per container id"""
+        with self._lock:
+            return dict(self._latest)
+
+    def _watch(self, container_id: str) -> None:
+        with self._lock:
+            if container_id in self._watched:
+                return
+            self._watched.add(container_id)
+        threading.Thread(target=self._consume, args=(container_id,), daemon=True).start()
+
+    def _consume(self, container_id: str) -> None:
+        try:
+            for stats in self._client.api.stats(container_id, stream=True, decode=True):
+                if self._stopped.is_set() or is_empty_sample(stats):
+                    break
+                with self._lock:
+                    self._latest[container_id] = stats
+        except Exception:
+            # Best effort: urllib3 errors from the raw stream surface here too
+            pass
+        finally:
+            with self._lock:
+                self._latest.pop(container_id, None)
+                self._watched.discard(container_id)
+
+    def _watch_events(self) -> None:
+        try:
+            for event in self._events:
+                if self._stopped.is_set():
+                    break
+                self._watch(event['id'])
+        except Exception:
+            # main() rebuilds the streamer once this thread has exited;
+            # until then containers without a stream fall back to per-tick reads
+            pass
+
+
+# Static part of the demo payload, built once; only live host stats change per tick
+_DEMO_TEMPLATE: Dict[str, Any] = {
+    "containers": [
+        {
+            "id": "abc123def456",
+            "name": "nginx-web",
+            "image": "nginx:alpine",
+            "status": "running",
+            "uptime": "3d 5h",
+            "restart_count": 0,
+            "cpu_percent": 12.5,
+            "memory_percent": 8.3,
+            "memory_usage": "256.0MB",
+            "network_rx": "1.2GB",
+            "network_tx": "856.0MB",
+            "has_alert": False,
+            "alert_messages": []
+        },
+        {
+            "id": "def456ghi789",
+            "name": "postgres-db",
+            "image": "postgres:15-alpine",
+            "status": "running",
+            "uptime": "7d 12h",
+            "cpu_percent": 25.8,
+            "memory_percent": 42.1,
+            "memory_usage": "1.3GB",
+            "network_rx": "5.8GB",
+            "network_tx": "3.2GB",
+            "has_alert": False,
+            "alert_messages": []
+        },
+        {
+            "id": "ghi789jkl012",
+            "name": "redis-cache",
+            "image": "redis:7-alpine",
+            "status": "running",
+            "uptime": "5d 8h",
+            "cpu_percent": 5.2,
+            "memory_percent": 15.6,
+            "memory_usage": "468.0MB",
+            "network_rx": "2.1GB",
+            "network_tx": "1.8GB",
+            "has_alert": False,
+            "alert_messages": []
+        },
+        {
+            "id": "jkl012mno345",
+            "name": "api-backend",
+            "image": "node:20-alpine",
+            "status": "running",
+            "uptime": "1d 3h",
+            "cpu_percent": 85.3,
+            "memory_percent": 68.9,
+            "memory_usage": "2.1GB",
+            "network_rx": "892.0MB",
+            "network_tx": "1.5GB",
+            "has_alert": True,
+            "alert_messages": [
+                "High CPU usage: 85.3%",
+                "High memory usage: 68.9%"
+            ]
+        },
+        {
+            "id": "mno345pqr678",
+            "name": "grafana",
+            "image": "grafana/grafana:latest",
+            "status": "running",
+            "uptime": "10d 2h",
+            "cpu_percent": 8.7,
+            "memory_percent": 22.4,
+            "memory_usage": "672.0MB",
+            "network_rx": "3.4GB",
+            "network_tx": "2.9GB",
+            "has_alert": False,
+            "alert_messages": []
+        },
+        {
+            "id": "vwx234yza567",
+            "name": "elasticsearch",
+            "image": "elasticsearch:8.10.0",
+            "status": "exited",
+            "uptime": "0",
             "cpu_percent": 0,
             "memory_percent": 0,
+            "memory_usage": "0.0B",
+            "network_rx": "12.0GB",
+            "network_tx": "8.5GB",
             "has_alert": False,
             "alert_messages": []
         }
+    ],
+    "system": {
+        "docker_version": "24.0.7",
+        "containers_total": 10,
+        "containers_running": 9,
+        "containers_paused": 0,
+        "containers_stopped": 1,
+    },
+}
 
 
 def get_demo_data() -> Dict[str, Any]:
     """Generate realistic demo/sample data for testing"""
-    return {
-        "containers": [
-            {
-                "id": "abc123def456",
-                "name": "nginx-web",
-                "image": "nginx:alpine",
-                "status": "running",
-                "uptime": "3d 5h",
-                "restart_count": 0,
-                "cpu_percent": 12.5,
-                "memory_percent": 8.3,
-                "memory_usage": "256.0MB",
-                "network_rx": "1.2GB",
-                "network_tx": "856.0MB",
-                "has_alert": False,
-                "alert_messages": []
-            },
-            {
-                "id": "def456ghi789",
-                "name": "postgres-db",
-                "image": "postgres:15-alpine",
-                "status": "running",
-                "uptime": "7d 12h",
-                "cpu_percent": 25.8,
-                "memory_percent": 42.1,
-                "memory_usage": "1.3GB",
-                "network_rx": "5.8GB",
-                "network_tx": "3.2GB",
-                "has_alert": False,
-                "alert_messages": []
-            },
-            {
-                "id": "ghi789jkl012",
-                "name": "redis-cache",
-                "image": "redis:7-alpine",
-                "status": "running",
-                "uptime": "5d 8h",
-                "cpu_percent": 5.2,
-                "memory_percent": 15.6,
-                "memory_usage": "468.0MB",
-                "network_rx": "2.1GB",
-                "network_tx": "1.8GB",
-                "has_alert": False,
-                "alert_messages": []
-            },
-            {
-                "id": "jkl012mno345",
-                "name": "api-backend",
-                "image": "node:20-alpine",
-                "status": "running",
-                "uptime": "1d 3h",
-                "cpu_percent": 85.3,
-                "memory_percent": 68.9,
-                "memory_usage": "2.1GB",
-                "network_rx": "892.0MB",
-                "network_tx": "1.5GB",
-                "has_alert": True,
-                "alert_messages": [
-                    "High CPU usage: 85.3%",
-                    "High memory usage: 68.9%"
-                ]
-            },
-            {
-                "id": "mno345pqr678",
-                "name": "grafana",
-                "image": "grafana/grafana:latest",
-                "status": "running",
-                "uptime": "10d 2h",
-                "cpu_percent": 8.7,
-                "memory_percent": 22.4,
-                "memory_usage": "672.0MB",
-                "network_rx": "3.4GB",
-                "network_tx": "2.9GB",
-                "has_alert": False,
-                "alert_messages": []
-            },
-            {
-                "id": "vwx234yza567",
-                "name": "elasticsearch",
-                "image": "elasticsearch:8.10.0",
-                "status": "exited",
-                "uptime": "0",
-                "cpu_percent": 0,
-                "memory_percent": 0,
-                "memory_usage": "0.0B",
-                "network_rx": "12.0GB",
-                "network_tx": "8.5GB",
-                "has_alert": False,
-                "alert_messages": []
-            }
-        ],
-        "system": {
-            "docker_version": "24.0.7",
-            "containers_total": 10,
-            "containers_running": 9,
-            "containers_paused": 0,
-            "containers_stopped": 1,
-            "cpu_percent": round(psutil.cpu_percent(interval=0.1, percpu=False), 1),
-            "memory_percent": round((psutil.virtual_memory().used / psutil.virtual_memory().total) * 100, 1)
-        },
-        "last_update": datetime.now().isoformat()
+    vm = psutil.virtual_memory()
+    data = _DEMO_TEMPLATE.copy()
+    data["system"] = {
+        **_DEMO_TEMPLATE["system"],
+        "cpu_percent": round(psutil.cpu_percent(interval=None), 1),
+        "memory_percent": round((vm.used / vm.total) * 100, 1)
     }
+    data["last_update"] = datetime.now().isoformat()
+    return data
 
 
-def collect_docker_data(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Collect Docker container data"""
+def connect_docker(config: Dict[str, Any]) -> docker.DockerClient:
+    """Connect to the Docker daemon, failing fast if it is unreachable"""
     docker_host = config.get('docker_host', 'unix:///var/run/docker.sock')
     docker_api_version = config.get('docker_api_version', '1.41')
+
+    # Size the keep-alive pool for the concurrent stats workers so their
+    # connections are reused instead of discarded
+    client = docker.DockerClient(base_url=docker_host, version=docker_api_version,
+                                 max_pool_size=MAX_STATS_WORKERS)
+    client.ping()
+    return client
+
+
+def collect_docker_data(client: docker.DockerClient, config: Dict[str, Any],
+                        latest_stats: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Collect Docker container data, using streamed stats samples from latest_stats when present"""
     show_stopped = config.get('show_stopped', False)
     cpu_threshold = int(config.get('cpu_threshold', 80))
     memory_threshold = int(config.get('memory_threshold', 85))
     sort_by = config.get('sort_by', 'cpu')
     sort_order = config.get('sort_order', 'desc')
+    compact = config.get('compact_payload', False)
 
-    # Connect to Docker
-    client = docker.DockerClient(base_url=docker_host, version=docker_api_version)
+    global _last_collect
 
     # Get system info
     info = client.info()
 
-    # Get all containers
-    containers_list = client.containers.list(all=show_stopped)
+    # Refresh cached details of containers restarted since the last collection
+    now = int(time.time())
+    if _last_collect is not None and _CONTAINER_META:
+        invalidate_restarted(client, _last_collect, now)
+    _last_collect = now
+
+    # Get all containers in one request; name, image and state come inlined
+    containers_list = client.api.containers(all=show_stopped)
 
-    # Process containers
+    # Forget cached details of containers that no longer exist
+    current_ids = {container['Id'] for container in containers_list}
+    for container_id in _CONTAINER_META.keys() - current_ids:
+        del _CONTAINER_META[container_id]
+
+    # Process containers; stats for running ones are fetched concurrently below
     containers_data = []
+    running = []
     for container in containers_list:
-        # Get restart count from container attrs
-        restart_count = container.attrs.get('RestartCount', 0)
+        container_id = container['Id']
+        meta = get_container_meta(client, container)
+        if meta is None:
+            continue
 
         container_info = {
-            "id": container.short_id,
-            "name": container.name,
-            "status": container.status,
-            "image": container.image.tags[0] if container.image.tags else container.image.short_id,
-            "restart_count": restart_count,
+            "id": container_id[:12],
+            "name": meta.name,
+            "status": meta.status,
+            "image": meta.image,
+            "restart_count": meta.restart_count,
         }
 
         # Get uptime for running containers
-        if container.status == "running":
-            started_at = container.attrs['State']['StartedAt']
-            container_info["uptime"] = format_uptime(started_at)
-
-            # Get stats for running containers
-            stats = get_container_stats(client, container, cpu_threshold, memory_threshold)
-            container_info.update(stats)
+        if meta.status == "running":
+            container_info["uptime"] = format_uptime(meta.started_at)
+            if latest_stats and container_id in latest_stats:
+                container_info.update(get_container_stats(client, container_id, cpu_threshold, memory_threshold,
+                                                          latest_stats[container_id], compact=compact))
+            else:
+                running.append((container_id, container_info))
         else:
-            container_info.update({
-                "cpu_percent": 0,
-                "memory_percent": 0,
-                "has_alert": False,
-                "alert_messages": []
-            })
+            container_info.update(idle_stats(compact))
 
         containers_data.append(container_info)
 
+    # Each remaining stats call is a blocking round trip to the daemon, so overlap them
+    if running:
+        with ThreadPoolExecutor(max_workers=min(MAX_STATS_WORKERS, len(running))) as executor:
+            futures = {
+                executor.submit(get_container_stats, client, container_id, cpu_threshold, memory_threshold,
+                                compact=compact): container_info
+                for container_id, container_info in running
+            }
+            for future in as_completed(futures):
+                futures[future].update(future.result())
+
     # Sort containers
-    reverse = (sort_order == 'desc')
-    if sort_by == 'cpu':
-        containers_data.sort(key=lambda x: x.get('cpu_percent', 0), reverse=reverse)
-    elif sort_by == 'memory':
-        containers_data.sort(key=lambda x: x.get('memory_percent', 0), reverse=reverse)
-    elif sort_by == 'name':
-        containers_data.sort(key=lambda x: x.get('name', ''), reverse=reverse)
-    elif sort_by == 'status':
-        containers_data.sort(key=lambda x: x.get('status', ''), reverse=reverse)
+    sort_key = SORT_KEYS.get(sort_by)
+    if sort_key:
+        containers_data.sort(key=sort_key, reverse=(sort_order == 'desc'))
 
     # Build response
+    vm = psutil.virtual_memory()
     return {
         "containers": containers_data,
         "system": {
@@ -295,25 +570,26 @@ def collect_docker_data(config: Dict[str, Any]) -> Dict[str, Any]:
             "containers_running": info.get('ContainersRunning', 0),
             "containers_paused": info.get('ContainersPaused', 0),
             "containers_stopped": info.get('ContainersStopped', 0),
-            "cpu_percent": round(psutil.cpu_percent(interval=0.1, percpu=False), 1),
-            "memory_percent": round((psutil.virtual_memory().used / psutil.virtual_memory().total) * 100, 1),
+            "cpu_percent": round(psutil.cpu_percent(interval=None), 1),
+            "memory_percent": round((vm.used / vm.total) * 100, 1),
         },
         "last_update": datetime.now().isoformat()
     }
 
 
-def push_to_webhook(webhook_url: str, data: Dict[str, Any], timeout: int = 10) -> bool:
-    """Push data to TRMNL webhook"""
+def push_to_webhook(webhook_url: str, data: Dict[str, Any], timeout: int = 10,
+                    compress: bool = False) -> bool:
+    """Push data to TRMNL webhook, gzip-encoding the body if compress is set"""
     try:
         # TRMNL expects data nested in merge_variables
         payload = {"merge_variables": data}
-        
-        response = requests.post(
-            webhook_url,
-            json=payload,
-            timeout=timeout,
-            headers={'Content-Type': 'application/json'}
-        )
+        body = json_dumps(payload)
+        headers = None
+        if compress:
+            body = gzip.compress(body)
+            headers = {'Content-Encoding': 'gzip'}
+
+        response = SESSION.post(webhook_url, data=body, headers=headers, timeout=timeout)
         response.raise_for_status()
         return True
     except requests.exceptions.RequestException as e:
@@ -321,37 +597,45 @@ def push_to_webhook(webhook_url: str, data: Dict[str, Any], timeout: int = 10) -
         return False
 
 
+def push_to_webhook_async(webhook_url: str, data: Dict[str, Any], timeout: int = 10,
+                          compress: bool = False) -> Future:
+    """Push data to TRMNL webhook in the background, returning a future for the result"""
+    return PUSH_EXECUTOR.submit(push_to_webhook, webhook_url, data, timeout, compress)
+
+
+def bool_from_str(value: str) -> bool:
+    """Interpret an environment variable value as a boolean"""
+    return value.lower() in ('true', '1', 'yes')
+
+
+# Environment variable -> (config key, type conversion)
+ENV_MAPPING = [
+    ('TRMNL_WEBHOOK_URL', 'webhook_url', str),
+    ('DOCKER_HOST', 'docker_host', str),
+    ('DOCKER_API_VERSION', 'docker_api_version', str),
+    ('SHOW_STOPPED', 'show_stopped', bool_from_str),
+    ('CPU_THRESHOLD', 'cpu_threshold', int),
+    ('MEMORY_THRESHOLD', 'memory_threshold', int),
+    ('SORT_BY', 'sort_by', str),
+    ('SORT_ORDER', 'sort_order', str),
+    ('COMPACT_PAYLOAD', 'compact_payload', bool_from_str),
+]
+
+
 def load_config(config_file: str = None) -> Dict[str, Any]:
     """Load configuration from file or environment"""
     config = {}
 
     # Load from config file if provided
     if config_file and os.path.exists(config_file):
-        with open(config_file, 'r') as f:
-            config = json.load(f)
+        with open(config_file, 'rb') as f:
+            config = json_loads(f.read())
 
     # Override with environment variables
-    env_mapping = {
-        'TRMNL_WEBHOOK_URL': 'webhook_url',
-        'DOCKER_HOST': 'docker_host',
-        'DOCKER_API_VERSION': 'docker_api_version',
-        'SHOW_STOPPED': 'show_stopped',
-        'CPU_THRESHOLD': 'cpu_threshold',
-        'MEMORY_THRESHOLD': 'memory_threshold',
-        'SORT_BY': 'sort_by',
-        'SORT_ORDER': 'sort_order',
-    }
-
-    for env_var, config_key in env_mapping.items():
-        if env_var in os.environ:
-            value = os.environ[env_var]
-            # Convert booleans
-            if config_key == 'show_stopped':
-                value = value.lower() in ('true', '1', 'yes')
-            # Convert numbers
-            elif config_key in ('cpu_threshold', 'memory_threshold'):
-                value = int(value)
-            config[config_key] = value
+    for env_var, config_key, coerce in ENV_MAPPING:
+        value = os.environ.get(env_var)
+        if value is not None:
+            config[config_key] = coerce(value)
 
     return config
 
@@ -405,8 +689,57 @@ def main():
     # Get interval
     interval = config.get('refresh_interval', args.interval)
 
+    # Compact payloads are also sent gzip-encoded
+    compress = config.get('compact_payload', False)
+
+    # Docker client shared across iterations; reconnected after a Docker error.
+    # In --loop mode stats also stream in the background so ticks avoid stats reads.
+    client = None
+    streamer = None
+
+    # In --loop mode pushes run in the background; at most one is in flight
+    pending_push = None
+
+    def report(success: bool) -> None:
+        if success:
+            if args.verbose:
+                print(f"  ✓ Successfully pushed data to TRMNL")
+        else:
+            print(f"  ✗ Failed to push data", file=sys.stderr)
+
+    def reap_push() -> None:
+        """Report the previous background push if it has finished, without waiting on it"""
+        nonlocal pending_push
+        if pending_push is None or not pending_push.done():
+            return
+        finished, pending_push = pending_push, None
+        error = finished.exception()
+        if error is not None:
+            # push_to_webhook only handles request errors, e.g. not encoding errors
+            print(f"ERROR: Failed to push to webhook: {error}", file=sys.stderr)
+            report(False)
+        else:
+            report(finished.result())
+
+    def push(payload: Dict[str, Any]) -> None:
+        nonlocal pending_push
+        reap_push()
+        if not args.loop:
+            report(push_to_webhook(webhook_url, payload, compress=compress))
+        elif pending_push is not None:
+            print(f"  ✗ Previous push still in progress, skipping this update", file=sys.stderr)
+        else:
+            pending_push = push_to_webhook_async(webhook_url, payload, compress=compress)
+
+    # systemd stops the service with SIGTERM; wake the interval wait instead of
+    # sleeping it out. Single runs keep the default handler and terminate.
+    if args.loop:
+        signal.signal(signal.SIGTERM, lambda *_: _stop.set())
+
     try:
         while True:
+            reap_push()
+
             try:
                 if args.verbose:
                     if args.demo:
@@ -418,28 +751,42 @@ def main():
                 if args.demo:
                     data = get_demo_data()
                 else:
-                    data = collect_docker_data(config)
+                    if client is None:
+                        client = connect_docker(config)
+                    # (Re)start streaming, also after the events stream died
+                    # with the daemon
+                    if args.loop and (streamer is None or not streamer.is_alive()):
+                        if streamer is not None:
+                            streamer.stop()
+                        streamer = StatsStreamer(client)
+                        streamer.start()
+                    data = collect_docker_data(client, config, streamer.snapshot() if streamer else None)
 
                 if args.verbose:
                     print(f"  Found {len(data['containers'])} containers")
                     print(f"  Pushing to webhook...")
 
                 # Push to webhook
-                success = push_to_webhook(webhook_url, data)
-
-                if success:
-                    if args.verbose:
-                        print(f"  ✓ Successfully pushed data to TRMNL")
-                else:
-                    print(f"  ✗ Failed to push data", file=sys.stderr)
+                push(data)
 
             except docker.errors.DockerException as e:
+                # Stop the streams first: closing the client only releases idle
+                # pooled connections, not those held by live streaming responses
+                if streamer is not None:
+                    streamer.stop()
+                if client is not None:
+                    try:
+                        client.close()
+                    except Exception:
+                        pass
+                client = None
+                streamer = None
                 error_data = {
                     "error": {"message": f"Docker connection failed: {str(e)}"},
                     "containers": [],
                     "system": {}
                 }
-                push_to_webhook(webhook_url, error_data)
+                push(error_data)
                 if args.verbose:
                     print(f"  ✗ Docker error: {e}", file=sys.stderr)
 
@@ -454,7 +801,10 @@ def main():
             # Wait for next iteration
             if args.verbose:
                 print(f"  Waiting {interval} seconds...\n")
-            time.sleep(interval)
+            if _stop.wait(interval):
+                if args.verbose:
+                    print("Shutdown requested... exiting")
+                break
 
     except KeyboardInterrupt:
         if args.verbose: